@@ -1,7 +1,6 @@
-from inspect import signature
 from types import MappingProxyType
-from typing import Callable, Type
-from .dependency import Dependency
+from typing import Any, Callable, Type
+from .dependency import Dependency, _UNSET, _extract_params, _has_forward_refs
 
 
 class Container:
@@ -15,33 +14,38 @@ class Container:
         dependencies (dict[Type, Dependency]): A dictionary that stores the registered dependencies.
 
     Methods:
-        __init__(self, dependencies: dict[str, Dependency] = {}): Initializes a new instance of the `Container` class.
+        __init__(self, dependencies: dict[Type, Dependency] = None): Initializes a new instance of the `Container` class.
         register_dependency(self, name: Type, dependency: Dependency): Registers a dependency with the specified name.
         register(self, name: Type, target: Type|Callable = None, cached: bool = False, autowired: bool = True): Registers a dependency with the specified name and target.
         resolve(self, name: Type): Resolves a dependency with the specified name.
 
     """
 
-    __dependencies: dict[Type, Dependency] = {}
-
-    def __init__(self, dependencies: dict[Type, Dependency] = {}):
+    def __init__(self, dependencies: dict[Type, Dependency] = None):
         """
         Initializes a new instance of the `Container` class.
 
         Args:
             dependencies (dict[Type, Dependency], optional): A dictionary of dependencies to be registered. Defaults to an empty dictionary.
+                The dictionary is copied, later changes to it are not seen by the container; use `register_dependency` instead.
         """
-        self.__dependencies = dependencies
+        self.__dependencies = {} if dependencies is None else dict(dependencies)
+        self.__view = MappingProxyType(self.__dependencies)
+        self.__resolvers: dict[Type, Callable[[], Any]] = {}
 
     def register_dependency(self, name: Type, dependency: Dependency):
         """
         Registers a dependency with the specified name.
 
+        The `target` and `autowire` of the dependency are fixed once it is registered, changing
+        them afterwards has no effect on how the container resolves it.
+
         Args:
             name (Type): The name of the dependency.
             dependency (Dependency): The dependency to be registered.
         """
         self.__dependencies[name] = dependency
+        self.__resolvers.clear()
 
     def register(self, name: Type, target: Type|Callable = None, cached: bool = False, autowired: bool = True):
         """
@@ -67,22 +71,129 @@ class Container:
         Returns:
             Any: The resolved dependency, or None if the dependency is not registered.
         """
-        if name not in self.__dependencies:
-            return None
+        resolver = self.__resolvers.get(name)
+        if resolver is None:
+            dependency = self.__dependencies.get(name)
+            if dependency is None:
+                return None
+            resolver = self.__compile(name, dependency)
 
-        dependency = self.__dependencies[name]
+        return resolver()
 
-        if not dependency.autowire:
-            return dependency.resolve()
-        
-        kwargs = {}
-        parameters = signature(dependency.target).parameters
+    def __compile(self, name: Type, dependency: Dependency) -> Callable[[], Any]:
+        """
+        Builds and stores a resolver specialized for a dependency.
 
-        for name, parameter in parameters.items():
-            if parameter.annotation in self.__dependencies:
-                kwargs[name] = self.resolve(parameter.annotation)
-            
-        return dependency.resolve(**kwargs)
+        The dependency graph below the dependency is flattened once into a list of steps in
+        resolution order, so the resolver builds the whole graph in a single loop instead of
+        resolving each parameter recursively.
+
+        Args:
+            name (Type): The name of the dependency.
+            dependency (Dependency): The dependency registered with the name.
+
+        Returns:
+            Callable[[], Any]: A function without arguments that resolves the dependency.
+        """
+        steps = []
+        self.__order(name, dependency, steps, set())
+
+        if len(steps) == 1 and not steps[0][2]:
+            resolver = dependency.resolve
+        else:
+            resolve = self.resolve
+
+            program = tuple(
+                (symbol, step, self.__builder(step), params, -len(params) if params else 0)
+                for symbol, step, params in steps
+            )
+
+            def resolver():
+                # Skip resolving the parameters once the instance exists
+                if dependency.cached and dependency.instance is not _UNSET:
+                    return dependency.instance
+
+                stack = []
+                push = stack.append
+
+                # `cached` is read on every resolution, so it can change after registration
+                for symbol, step, builder, params, start in program:
+                    if params is None:
+                        instance = step.instance
+                        push(instance if step.cached and instance is not _UNSET else resolve(symbol))
+                        continue
+
+                    call = step.resolve if step.cached else builder
+                    if start:
+                        values = stack[start:]
+                        del stack[start:]
+                        push(call(**dict(zip(params, values))))
+                    else:
+                        push(call())
+
+                return stack[0]
+
+        self.__resolvers[name] = resolver
+        return resolver
+
+    @staticmethod
+    def __builder(dependency: Dependency) -> Callable:
+        """
+        Returns the callable that builds a dependency while it isn't cached, skipping
+        `Dependency.resolve` when it would only forward the arguments to the target.
+        """
+        if type(dependency).resolve is not Dependency.resolve:
+            return dependency.resolve
+        return dependency.target
+
+    def __order(self, name: Type, dependency: Dependency, steps: list, path: set):
+        """
+        Appends the steps to resolve a dependency after the steps to resolve its parameters.
+
+        Each step is a `(name, dependency, params)` tuple where `params` holds the names of the
+        parameters taken from the previous results, or None for cached dependencies, which are
+        resolved on their own.
+
+        Args:
+            name (Type): The name of the dependency.
+            dependency (Dependency): The dependency registered with the name.
+            steps (list): The steps resolved so far.
+            path (set): The names of the dependencies being ordered, used to detect cycles.
+
+        Raises:
+            RecursionError: If the dependency depends on itself.
+        """
+        params = []
+
+        if dependency.autowire and _has_forward_refs(dependency.types):
+            # Retry annotations that referenced names not defined yet at registration
+            dependency.types, dependency.defaults, dependency.strings = _extract_params(dependency.target)
+
+        if dependency.autowire and dependency.types:
+            path.add(name)
+
+            for param, symbol in dependency.types:
+                # Names registered with the annotation string itself take precedence
+                string = dependency.strings.get(param)
+                if string is not None and string in self.__dependencies:
+                    symbol = string
+
+                inner = self.__dependencies.get(symbol)
+                if inner is None:
+                    continue
+
+                if inner.cached:
+                    steps.append((symbol, inner, None))
+                elif symbol in path:
+                    raise RecursionError(f"Circular dependency found while resolving {symbol}")
+                else:
+                    self.__order(symbol, inner, steps, path)
+
+                params.append(param)
+
+            path.discard(name)
+
+        steps.append((name, dependency, tuple(params)))
 
     def has(self, name: Type) -> bool:
         """
@@ -100,7 +211,7 @@ class Container:
         """
         Returns a read-only view of the container's dependencies.
         """
-        return MappingProxyType(self.__dependencies)
+        return self.__view
 
             
         
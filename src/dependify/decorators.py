@@ -1,24 +1,29 @@
 from functools import wraps
-from inspect import signature
 from typing import Type
 
 from .container import Container
 from .context import _container, register
+from .dependency import _extract_params
 
 
-def __get_existing_annot(f, container: Container = _container) -> dict[str, Type]:
+def __get_existing_annot(params: tuple, container: Container = _container) -> dict[str, Type]:
     """
-    Get the existing annotations in a function.
+    Get the existing annotations in the parameters of a function.
     """
     existing_annot = {}
-    parameters = signature(f).parameters
+    types, defaults, strings = params
 
-    for name, parameter in parameters.items():
-        if parameter.default != parameter.empty:
+    for name, annotation in types:
+        if name in defaults:
             continue
 
-        if container.has(parameter.annotation):
-            existing_annot[name] = parameter.annotation
+        # Names registered with the annotation string itself take precedence
+        string = strings.get(name)
+        if string is not None and container.has(string):
+            annotation = string
+
+        if container.has(annotation):
+            existing_annot[name] = annotation
 
     return existing_annot
     
@@ -31,9 +36,16 @@ def inject(_func=None, *, container: Container = _container):
         container (Container): the container used to inject the dependencies. Defaults to module container.
     """
     def decorated(func):
+        params = None
+
         @wraps(func)
         def subdecorator(*args, **kwargs):
-            for name, annotation in __get_existing_annot(func, container).items():
+            nonlocal params
+            if params is None:
+                # Extracted on the first call so names defined after the decoration are resolved
+                params = _extract_params(func)
+
+            for name, annotation in __get_existing_annot(params, container).items():
                 kwargs[name] = container.resolve(annotation)
             return func(*args, **kwargs)
         return subdecorator
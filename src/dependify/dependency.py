@@ -1,4 +1,185 @@
+from types import FunctionType, MappingProxyType
 from typing import Any, Callable, Type
+from weakref import WeakKeyDictionary
+
+
+# Code object flags, as in `inspect`, which is only imported when a target needs it
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+
+
+def _no_arguments():
+    """
+    Stands in for the constructor of classes that don't define `__init__` or `__new__`.
+    """
+
+
+def _plain_function(target: Callable|Type) -> tuple[FunctionType, bool]|None:
+    """
+    Returns the plain Python function called when invoking the target and whether its
+    first argument is bound (`self`), or None if the target has to go through `inspect`.
+    """
+    if isinstance(target, type):
+        if type(target).__call__ is not type.__call__ or target.__new__ is not object.__new__:
+            return None
+
+        init = target.__init__
+        if init is object.__init__:
+            return _no_arguments, False
+        if type(init) is FunctionType and not hasattr(init, '__wrapped__'):
+            return init, True
+        return None
+
+    if type(target) is FunctionType and not hasattr(target, '__wrapped__'):
+        return target, False
+
+    return None
+
+
+def _evaluate(annotation: str, func: FunctionType) -> Any:
+    """
+    Evaluates a string annotation (quoted or postponed with `from __future__ import annotations`)
+    in the namespace of the function, or returns it unchanged if it can't be resolved.
+    """
+    try:
+        return eval(annotation, func.__globals__)
+    except Exception:
+        return annotation
+
+
+def _fast_introspect(target: Callable|Type) -> tuple[dict[str, Type], dict[str, Any], dict[str, str]]:
+    """
+    Returns the annotated parameter types, the parameter defaults and the unevaluated string
+    annotations of the target.
+
+    Plain functions and classes with a plain `__init__` are read directly from their
+    code object, anything else (builtins, partials, wrapped callables, ...) falls back
+    to `inspect.signature`. String annotations are evaluated when possible.
+    """
+    types = {}
+    defaults = {}
+    strings = {}
+    plain = _plain_function(target)
+
+    if plain is None:
+        from inspect import signature, _empty
+
+        try:
+            parameters = signature(target).parameters
+        except ValueError:
+            # Builtins without signature metadata have nothing to autowire
+            return types, defaults, strings
+
+        for name, parameter in parameters.items():
+            if isinstance(parameter.annotation, str):
+                strings[name] = parameter.annotation
+
+        if strings:
+            try:
+                parameters = signature(target, eval_str=True).parameters
+            except Exception:
+                pass
+
+        for name, parameter in parameters.items():
+            if parameter.annotation is not _empty:
+                types[name] = parameter.annotation
+            if parameter.default is not _empty:
+                defaults[name] = parameter.default
+        return types, defaults, strings
+
+    func, bound = plain
+    code = func.__code__
+    if (
+        code.co_argcount + code.co_kwonlyargcount <= bound
+        and not code.co_flags & (_CO_VARARGS | _CO_VARKEYWORDS)
+    ):
+        # Nothing to inject besides `self`
+        return types, defaults, strings
+
+    varnames = code.co_varnames
+    positional = varnames[:code.co_argcount]
+    keyword = varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+    index = code.co_argcount + code.co_kwonlyargcount
+    var_positional = var_keyword = ()
+    if code.co_flags & _CO_VARARGS:
+        var_positional = varnames[index:index + 1]
+        index += 1
+    if code.co_flags & _CO_VARKEYWORDS:
+        var_keyword = varnames[index:index + 1]
+    annotations = func.__annotations__
+
+    for name in positional[bound:] + var_positional + keyword + var_keyword:
+        if name in annotations:
+            annotation = annotations[name]
+            if isinstance(annotation, str):
+                strings[name] = annotation
+                annotation = _evaluate(annotation, func)
+            types[name] = annotation
+
+    values = func.__defaults__ or ()
+    if values:
+        defaults.update(zip(positional[-len(values):], values))
+    if func.__kwdefaults__:
+        defaults.update(func.__kwdefaults__)
+
+    return types, defaults, strings
+
+
+# Marks a cached dependency that hasn't been resolved yet, since None is a valid instance
+_UNSET = object()
+
+_EMPTY_MAPPING = MappingProxyType({})
+_NO_PARAMS = ((), _EMPTY_MAPPING, _EMPTY_MAPPING)
+
+
+def _freeze_params(
+    target: Callable|Type,
+) -> tuple[tuple[tuple[str, Type], ...], MappingProxyType, MappingProxyType]:
+    """
+    Returns the annotated parameters of the target as `(name, type)` pairs and read-only
+    views of its parameter defaults and string annotations, sharing a single instance for
+    targets without any.
+    """
+    types, defaults, strings = _fast_introspect(target)
+    if not types and not defaults:
+        return _NO_PARAMS
+    return (
+        tuple(types.items()),
+        MappingProxyType(defaults) if defaults else _EMPTY_MAPPING,
+        MappingProxyType(strings) if strings else _EMPTY_MAPPING,
+    )
+
+
+def _has_forward_refs(types: tuple[tuple[str, Type], ...]) -> bool:
+    """
+    Checks if any annotation is still a string that couldn't be evaluated.
+    """
+    return any(isinstance(symbol, str) for _, symbol in types)
+
+
+# Weakly keyed so targets of discarded containers and decorated closures can be collected
+_params_cache: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _extract_params(
+    target: Callable|Type,
+) -> tuple[tuple[tuple[str, Type], ...], MappingProxyType, MappingProxyType]:
+    """
+    Returns the parameters of the target as given by `_freeze_params`, memoized per target
+    once all of its annotations are evaluated, so forward references are retried.
+    """
+    try:
+        return _params_cache[target]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable callables and those without weak reference support can't be memoized
+        return _freeze_params(target)
+
+    params = _freeze_params(target)
+    if not _has_forward_refs(params[0]):
+        _params_cache[target] = params
+    return params
 
 
 class Dependency:
@@ -6,10 +187,15 @@ class Dependency:
     Represents a dependency that can be resolved and injected into other classes or functions.
     """
 
-    cached: bool = False
-    autowire: bool = True
-    instance: Any = None
+    __slots__ = ('target', 'cached', 'autowire', 'instance', 'types', 'defaults', 'strings')
+
+    cached: bool
+    autowire: bool
+    instance: Any
     target: Callable|Type
+    types: tuple[tuple[str, Type], ...]
+    defaults: MappingProxyType[str, Any]
+    strings: MappingProxyType[str, str]
 
     def __init__(self, target: Callable|Type, cached: bool = False, autowire: bool = True):
         """
@@ -19,10 +205,18 @@ class Dependency:
             target (Callable|Type): The target function or class to resolve the dependency.
             cached (bool, optional): Indicates whether the dependency should be cached. Defaults to False.
             autowire (bool, optional): Indicates whether the dependency arguments should be autowired. Defaults to True.
+
+        Raises:
+            TypeError: If the target is not callable.
         """
+        if not callable(target):
+            raise TypeError(f"Dependency target must be callable, got {target!r}")
+
         self.target = target
         self.cached = cached
         self.autowire = autowire
+        self.instance = _UNSET
+        self.types, self.defaults, self.strings = _extract_params(target) if autowire else _NO_PARAMS
     
     def resolve(self, *args, **kwargs):
         """
@@ -36,7 +230,7 @@ class Dependency:
             The resolved dependency object.
         """
         if self.cached:
-            if not self.instance:
+            if self.instance is _UNSET:
                 self.instance = self.target(*args, **kwargs)
             return self.instance
         return self.target(*args, **kwargs)
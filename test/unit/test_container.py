@@ -2,6 +2,33 @@ from unittest import TestCase
 from dependify import Container
 
 
+class Service:
+    def __init__(self, repository: 'Repository'):
+        self.repository = repository
+
+
+# Registered before the annotation of Service can be evaluated
+forward_container = Container()
+forward_container.register(Service)
+
+
+class Repository:
+    pass
+
+
+forward_container.register(Repository)
+
+
+class CircularA:
+    def __init__(self, b: 'CircularB'):
+        self.b = b
+
+
+class CircularB:
+    def __init__(self, a: CircularA):
+        self.a = a
+
+
 class TestContainer(TestCase):
 
     def test_container_register_class(self):
@@ -115,4 +142,203 @@ class TestContainer(TestCase):
         container.register(B)
 
         with self.assertRaisesRegex(TypeError, "missing 1 required positional argument"):
-            container.resolve(A)
\ No newline at end of file
+            container.resolve(A)
+
+    def test_container_instances_isolated(self):
+        """
+        Test if separate containers don't share their registered dependencies.
+        """
+        class A:
+            pass
+
+        container1 = Container()
+        container2 = Container()
+        container1.register(A)
+        self.assertTrue(container1.has(A))
+        self.assertFalse(container2.has(A))
+
+    def test_container_resolve_registered_after_resolve(self):
+        """
+        Test if a dependency registered after a first resolution is injected afterwards.
+        """
+        class B:
+            pass
+
+        class A:
+            def __init__(self, b: B = None):
+                self.b = b
+
+        container = Container()
+        container.register(A)
+        self.assertIsNone(container.resolve(A).b)
+        container.register(B)
+        self.assertIsInstance(container.resolve(A).b, B)
+
+    def test_container_resolve_cached_skips_dependencies(self):
+        """
+        Test if the dependencies of a cached dependency are only resolved once.
+        """
+        calls = []
+
+        class B:
+            def __init__(self):
+                calls.append(1)
+
+        class A:
+            def __init__(self, b: B):
+                self.b = b
+
+        container = Container()
+        container.register(A, cached=True)
+        container.register(B)
+        result1 = container.resolve(A)
+        result2 = container.resolve(A)
+        self.assertIs(result1, result2)
+        self.assertEqual(len(calls), 1)
+
+    def test_container_resolve_nested_dependencies(self):
+        """
+        Test if every level of a dependency graph is resolved with new instances.
+        """
+        class D:
+            pass
+
+        class C:
+            def __init__(self, d: D):
+                self.d = d
+
+        class B:
+            def __init__(self, d: D):
+                self.d = d
+
+        class A:
+            def __init__(self, b: B, c: C):
+                self.b = b
+                self.c = c
+
+        container = Container()
+        container.register(A)
+        container.register(B)
+        container.register(C)
+        container.register(D)
+        result = container.resolve(A)
+        self.assertIsInstance(result.b, B)
+        self.assertIsInstance(result.c, C)
+        self.assertIsInstance(result.b.d, D)
+        self.assertIsInstance(result.c.d, D)
+        self.assertIsNot(result.b.d, result.c.d)
+
+    def test_container_resolve_circular_dependency(self):
+        """
+        Test if a circular dependency raises an error.
+        """
+        container = Container()
+        container.register(CircularA)
+        container.register(CircularB)
+
+        with self.assertRaises(RecursionError):
+            container.resolve(CircularA)
+
+    def test_container_dependencies_view(self):
+        """
+        Test if the dependencies view is read-only and reflects later registrations.
+        """
+        class A:
+            pass
+
+        container = Container()
+        dependencies = container.dependencies()
+        container.register(A)
+        self.assertIn(A, dependencies)
+
+        with self.assertRaises(TypeError):
+            dependencies[A] = None
+
+    def test_container_register_not_callable(self):
+        """
+        Test if registering a target that is not callable fails at registration.
+        """
+        class A:
+            pass
+
+        container = Container()
+
+        with self.assertRaisesRegex(TypeError, "must be callable"):
+            container.register(A, A(), autowired=False)
+
+    def test_container_resolve_forward_reference(self):
+        """
+        Test if a string annotation referring to a class defined later is resolved.
+        """
+        result = forward_container.resolve(Service)
+        self.assertIsInstance(result.repository, Repository)
+
+        container = Container()
+        container.register(Service)
+        container.register(Repository)
+        result = container.resolve(Service)
+        self.assertIsInstance(result.repository, Repository)
+
+    def test_container_initial_dependencies_copied(self):
+        """
+        Test if the initial dependencies are copied and registered dependencies are injected.
+        """
+        from dependify import Dependency
+
+        class B:
+            pass
+
+        class A:
+            def __init__(self, b: B = None):
+                self.b = b
+
+        dependencies = {A: Dependency(A)}
+        container = Container(dependencies)
+        self.assertIsNone(container.resolve(A).b)
+
+        dependencies[B] = Dependency(B)
+        self.assertFalse(container.has(B))
+
+        container.register_dependency(B, Dependency(B))
+        self.assertIsInstance(container.resolve(A).b, B)
+
+    def test_container_resolve_cached_changed_after_resolve(self):
+        """
+        Test if changing the `cached` property after a first resolution is taken into account.
+        """
+        class B:
+            pass
+
+        class A:
+            def __init__(self, b: B):
+                self.b = b
+
+        container = Container()
+        container.register(A)
+        container.register(B)
+        container.resolve(A)
+
+        container.dependencies()[B].cached = True
+        self.assertIs(container.resolve(A).b, container.resolve(A).b)
+
+        container.dependencies()[A].cached = True
+        self.assertIs(container.resolve(A), container.resolve(A))
+
+        container.dependencies()[A].cached = False
+        container.dependencies()[B].cached = False
+        result1 = container.resolve(A)
+        result2 = container.resolve(A)
+        self.assertIsNot(result1, result2)
+        self.assertIsNot(result1.b, result2.b)
+
+    def test_container_resolve_string_name(self):
+        """
+        Test if a string annotation is matched against a dependency registered with that string.
+        """
+        def func(config: 'Container'):
+            return config
+
+        container = Container()
+        container.register('Container', lambda: 'config')
+        container.register(func)
+        self.assertEqual(container.resolve(func), 'config')
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from unittest import TestCase
 from dependify import Dependency
 
@@ -66,3 +68,120 @@ class TestDependency(TestCase):
         result1 = dependency.resolve()
         result2 = dependency.resolve()
         self.assertIsNot(result1, result2)
+
+    def test_dependency_parameters(self):
+        """
+        Test if the annotated parameters and defaults of the target are extracted.
+        """
+        class B:
+            pass
+
+        class A:
+            def __init__(self, b: B, value: int = 1, other=None):
+                pass
+
+        dependency = Dependency(target=A)
+        self.assertEqual(dependency.types, (('b', B), ('value', int)))
+        self.assertEqual(dependency.defaults, {'value': 1, 'other': None})
+
+    def test_dependency_parameters_function(self):
+        """
+        Test if the annotated parameters and defaults of a function target are extracted.
+        """
+        class B:
+            pass
+
+        def func(b: B, *, value: int = 1):
+            pass
+
+        dependency = Dependency(target=func)
+        self.assertEqual(dependency.types, (('b', B), ('value', int)))
+        self.assertEqual(dependency.defaults, {'value': 1})
+
+    def test_dependency_parameters_memoized(self):
+        """
+        Test if the extracted parameters are shared between dependencies of the same target.
+        """
+        class A:
+            def __init__(self, value: int = 1):
+                pass
+
+        dependency1 = Dependency(target=A)
+        dependency2 = Dependency(target=A)
+        self.assertIs(dependency1.types, dependency2.types)
+        self.assertIs(dependency1.defaults, dependency2.defaults)
+
+    def test_dependency_resolve_cached_falsy(self):
+        """
+        Test if a falsy instance is cached when the `cached` property is set to `True`.
+        """
+        calls = []
+
+        def func():
+            calls.append(1)
+            return []
+
+        dependency = Dependency(target=func, cached=True)
+        result1 = dependency.resolve()
+        result2 = dependency.resolve()
+        self.assertIs(result1, result2)
+        self.assertEqual(len(calls), 1)
+
+    def test_dependency_parameters_shared_when_empty(self):
+        """
+        Test if dependencies without parameters share the same extracted parameters.
+        """
+        class A:
+            pass
+
+        class B:
+            def __init__(self):
+                pass
+
+        dependency1 = Dependency(target=A)
+        dependency2 = Dependency(target=B)
+        self.assertIs(dependency1.types, dependency2.types)
+        self.assertIs(dependency1.defaults, dependency2.defaults)
+
+    def test_dependency_parameters_string_annotations(self):
+        """
+        Test if string annotations are evaluated when extracting the parameters.
+        """
+        class A:
+            def __init__(self, value: 'int', other: 'Undefined' = None):
+                pass
+
+        dependency = Dependency(target=A)
+        self.assertEqual(dependency.types, (('value', int), ('other', 'Undefined')))
+
+    def test_dependency_resolve_cached_none(self):
+        """
+        Test if a None result is cached when the `cached` property is set to `True`.
+        """
+        calls = []
+
+        def func():
+            calls.append(1)
+
+        dependency = Dependency(target=func, cached=True)
+        dependency.resolve()
+        dependency.resolve()
+        self.assertEqual(len(calls), 1)
+
+    def test_dependency_target_not_kept_alive(self):
+        """
+        Test if extracting the parameters of a target doesn't keep it alive.
+        """
+        class B:
+            pass
+
+        class A:
+            def __init__(self, b: B):
+                self.b = b
+
+        dependency = Dependency(target=A)
+        factory = Dependency(target=lambda b: A(b)).target
+        refs = [weakref.ref(A), weakref.ref(factory)]
+        del dependency, factory, A
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None, None])
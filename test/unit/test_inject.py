@@ -1,6 +1,26 @@
+import gc
+import os
+import subprocess
+import sys
+import weakref
 from unittest import TestCase
 from unittest.mock import patch
-from dependify import inject
+from dependify import Container, inject
+
+
+forward_container = Container()
+
+
+@inject(container=forward_container)
+def use_later(later: 'Later'):
+    return later
+
+
+class Later:
+    pass
+
+
+forward_container.register(Later)
 
 
 class TestInject(TestCase):
@@ -40,4 +60,109 @@ class TestInject(TestCase):
 
         test()
     
-    
\ No newline at end of file
+    
+    def test_inject_skips_defaults(self):
+        """
+        Test if parameters with defaults are not injected.
+        """
+        from dependify import Container
+
+        class A:
+            pass
+
+        container = Container()
+        container.register(A)
+
+        @inject(container=container)
+        def test(a: A, b: A = None):
+            return a, b
+
+        a, b = test()
+        self.assertIsInstance(a, A)
+        self.assertIsNone(b)
+
+    def test_inject_function_not_kept_alive(self):
+        """
+        Test if a decorated function can be collected once it is no longer referenced.
+        """
+        from dependify import Container
+
+        class A:
+            pass
+
+        container = Container()
+        container.register(A)
+
+        def test(a: A):
+            return a
+
+        injected = inject(test, container=container)
+        self.assertIsInstance(injected(), A)
+        ref = weakref.ref(test)
+        del test, injected
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_inject_string_name(self):
+        """
+        Test if a string annotation is matched against a dependency registered with that string.
+        """
+        from dependify import Container
+
+        container = Container()
+        container.register('Container', lambda: 'config')
+
+        @inject(container=container)
+        def test(config: 'Container'):
+            return config
+
+        self.assertEqual(test(), 'config')
+
+    def test_inject_forward_reference(self):
+        """
+        Test if a string annotation referring to a class defined after the decoration is injected.
+        """
+        self.assertIsInstance(use_later(), Later)
+
+    def test_inject_unresolvable_annotation_extracted_once(self):
+        """
+        Test if the parameters are not extracted again on every call when an annotation can't be resolved.
+        """
+        from dependify.dependency import _extract_params
+
+        with patch('dependify.decorators._extract_params', wraps=_extract_params) as mock_extract:
+            @inject(container=Container())
+            def test(value: 'Undefined' = None):
+                return value
+
+            test()
+            test()
+
+        self.assertEqual(mock_extract.call_count, 1)
+
+    def test_inject_without_inspect(self):
+        """
+        Test if importing the package, resolving and injecting plain classes doesn't import `inspect`.
+        """
+        code = (
+            "import sys\n"
+            "from dependify import Container, inject\n"
+            "class B:\n"
+            "    pass\n"
+            "class A:\n"
+            "    def __init__(self, b: B):\n"
+            "        self.b = b\n"
+            "container = Container()\n"
+            "container.register(A)\n"
+            "container.register(B)\n"
+            "assert isinstance(container.resolve(A).b, B)\n"
+            "@inject(container=container)\n"
+            "def use(b: B):\n"
+            "    return b\n"
+            "assert isinstance(use(), B)\n"
+            "assert 'inspect' not in sys.modules\n"
+        )
+        src = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(src))
+        result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)